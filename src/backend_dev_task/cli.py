@@ -8,7 +8,12 @@ from typing import Iterable, Mapping
 
 from .config import LayoutConfig, LoadConfig
 from .layout_service import LayoutCalculator
-from .models import LayoutContext
+from .models import LayoutContext, LayoutResult
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def LoadSamplePanels() -> Iterable[Mapping[str, float]]:
@@ -26,22 +31,30 @@ def LoadSamplePanels() -> Iterable[Mapping[str, float]]:
     ]
 
 
+def SerializeLayout(layout: LayoutResult) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(
+            {"mounts": layout.mounts, "joints": layout.joints},
+            option=orjson.OPT_INDENT_2,
+        )
+    payload = {
+        "mounts": [{"x": mount.x, "y": mount.y} for mount in layout.mounts],
+        "joints": [{"x": joint.x, "y": joint.y} for joint in layout.joints],
+    }
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
 def WriteLayoutToFile(
     result_dir: Path | None = None, config: LayoutConfig | None = None
 ) -> tuple[Path, LayoutContext, str]:
     if result_dir is None:
         result_dir = Path("output")
     result_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     result_path = result_dir / f"layout_{timestamp}.json"
     calculator = LayoutCalculator(config=config)
     context = calculator.CalculateLayoutDetailed(LoadSamplePanels())
-    layout = context.result
-    payload = {
-        "mounts": [{"x": mount.x, "y": mount.y} for mount in layout.mounts],
-        "joints": [{"x": joint.x, "y": joint.y} for joint in layout.joints],
-    }
-    result_path.write_text(json.dumps(payload, indent=2))
+    result_path.write_bytes(SerializeLayout(context.result))
     print(f"Layout written to {result_path}")
     return result_path, context, timestamp
 
@@ -67,7 +80,7 @@ def ParseArgs() -> argparse.Namespace:
         "--config",
         type=Path,
         default=None,
-        help="Optional path to a YAML configuration file.",
+        help="Optional path to a YAML or JSON configuration file.",
     )
     parser.add_argument(
         "--output-dir",
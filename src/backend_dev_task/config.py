@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Mapping
+from typing import Any, Dict, Mapping, Tuple
 
 import yaml
 
 from .exceptions import LayoutValidationError
 
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int, int], LayoutConfig]] = {}
+_DEFAULT_CONFIG: LayoutConfig | None = None
+
 
 @dataclass(frozen=True)
 class PanelSettings:
@@ -60,26 +66,27 @@ class LayoutConfig:
 def _BuildSection(data: Mapping[str, Any] | None, cls: type) -> Any:
     if not data:
         return cls()
-    return cls(**{key: value for key, value in data.items()})
+    return cls(**data)
 
 
-def _ReadYaml(path: Path) -> Dict[str, Any]:
+def _ReadConfigFile(path: Path) -> Dict[str, Any]:
     try:
-        text = path.read_text(encoding="utf-8")
+        raw = path.read_bytes()
     except FileNotFoundError as error:
         raise LayoutValidationError(
             f"Configuration file '{path}' was not found.") from error
-    payload = yaml.safe_load(text) or {}
+    try:
+        payload = json.loads(raw)
+    except ValueError:
+        payload = yaml.load(raw, Loader=_YAML_LOADER)
+    payload = payload or {}
     if not isinstance(payload, dict):
         raise LayoutValidationError(
             "Configuration file must define a mapping at the root level.")
     return payload
 
 
-def LoadConfig(path: Path | None = None) -> LayoutConfig:
-    payload: Dict[str, Any] = {}
-    if path is not None:
-        payload = _ReadYaml(path)
+def _BuildConfig(payload: Mapping[str, Any]) -> LayoutConfig:
     return LayoutConfig(
         panel=_BuildSection(payload.get("panel"), PanelSettings),
         rafters=_BuildSection(payload.get("rafters"), RafterSettings),
@@ -88,3 +95,27 @@ def LoadConfig(path: Path | None = None) -> LayoutConfig:
         validation=_BuildSection(payload.get(
             "validation"), ValidationSettings),
     )
+
+
+def _StatConfig(path: Path) -> Tuple[str, Tuple[int, int, int]]:
+    try:
+        stat = path.stat()
+        return str(path.resolve()), (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    except FileNotFoundError as error:
+        raise LayoutValidationError(
+            f"Configuration file '{path}' was not found.") from error
+
+
+def LoadConfig(path: Path | None = None) -> LayoutConfig:
+    global _DEFAULT_CONFIG
+    if path is None:
+        if _DEFAULT_CONFIG is None:
+            _DEFAULT_CONFIG = LayoutConfig()
+        return _DEFAULT_CONFIG
+    resolved, stamp = _StatConfig(path)
+    cached = _CONFIG_CACHE.get(resolved)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    config = _BuildConfig(_ReadConfigFile(path))
+    _CONFIG_CACHE[resolved] = (stamp, config)
+    return config
@@ -1,39 +1,55 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import Dict, List, Sequence
+from typing import Dict, List, Sequence, Tuple
 
 from .models import Joint, Panel
 
 
-def _FindRowKey(row_map: Dict[float, List[Panel]], y_value: float, tolerance: float) -> float:
-    for key in row_map:
-        if abs(key - y_value) <= tolerance:
-            return key
-    return y_value
+def _GroupRows(panels: Sequence[Panel], tolerance: float) -> Dict[float, List[Panel]]:
+    row_map: Dict[float, List[Panel]] = {}
+    if tolerance <= 0:
+        for panel in panels:
+            row_map.setdefault(panel.y, []).append(panel)
+        return row_map
+    buckets: Dict[int, Tuple[int, float]] = {}
+    for panel in panels:
+        bucket = math.floor(panel.y / tolerance)
+        match: Tuple[int, float] | None = None
+        for neighbour in (bucket - 1, bucket, bucket + 1):
+            candidate = buckets.get(neighbour)
+            if candidate is None or abs(candidate[1] - panel.y) > tolerance:
+                continue
+            if match is None or candidate[0] < match[0]:
+                match = candidate
+        if match is None:
+            buckets[bucket] = (len(row_map), panel.y)
+            row_map[panel.y] = [panel]
+        else:
+            row_map[match[1]].append(panel)
+    return row_map
 
 
-@dataclass
+@dataclass(slots=True)
 class JointCalculator:
     horizontal_gap_threshold: float = 1.0
     vertical_tolerance: float = 0.5
 
     def CalculateJoints(self, panels: Sequence[Panel]) -> List[Joint]:
-        row_map: Dict[float, List[Panel]] = {}
-        for panel in panels:
-            row_key = _FindRowKey(row_map, panel.y, self.vertical_tolerance)
-            row_map.setdefault(row_key, []).append(panel)
+        row_map = _GroupRows(panels, self.vertical_tolerance)
         joints: Dict[tuple[float, float], Joint] = {}
+        threshold = self.horizontal_gap_threshold
         for row_key, row_panels in row_map.items():
             row_panels.sort(key=lambda panel: panel.x)
+            top_y = round(row_key, 4)
             for left, right in zip(row_panels, row_panels[1:]):
-                gap = right.x - left.RightEdge()
-                if gap >= self.horizontal_gap_threshold:
+                left_edge = left.RightEdge()
+                if right.x - left_edge >= threshold:
                     continue
-                seam_x = (left.RightEdge() + right.x) / 2.0
-                top_joint = Joint(x=round(seam_x, 4), y=round(row_key, 4))
-                bottom_joint = Joint(x=round(seam_x, 4),
-                                     y=round(row_key + left.height, 4))
-                joints[(top_joint.x, top_joint.y)] = top_joint
-                joints[(bottom_joint.x, bottom_joint.y)] = bottom_joint
+                seam_x = round((left_edge + right.x) / 2.0, 4)
+                bottom_y = round(row_key + left.height, 4)
+                for key in ((seam_x, top_y), (seam_x, bottom_y)):
+                    if key not in joints:
+                        joints[key] = Joint(x=key[0], y=key[1])
         return sorted(joints.values(), key=lambda item: (item.y, item.x))
@@ -1,65 +1,83 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import Iterable, List, Mapping, Set, Tuple
+from typing import Dict, Iterable, List, Mapping, Set, Tuple
 
 from .config import LayoutConfig, LoadConfig, ValidationSettings
 from .exceptions import LayoutValidationError
 from .joints import JointCalculator
-from .models import LayoutContext, LayoutResult, Panel, PanelDimensions
+from .models import LayoutContext, LayoutResult, Panel, PanelBounds
 from .mounts import MountCalculator
 from .rafters import RafterFactory
 
 
-@dataclass
+@dataclass(slots=True)
 class PanelFactory:
-    dimensions: PanelDimensions
+    width: float
+    height: float
     validation: ValidationSettings
 
     def BuildPanels(self, specs: Iterable[Mapping[str, float]]) -> List[Panel]:
         panels: List[Panel] = []
         seen_positions: Set[Tuple[int, int]] = set()
         tolerance = self.validation.coordinate_tolerance
+        check_bounds = not self.validation.allow_negative_coordinates
+        check_duplicates = not self.validation.allow_duplicates
+        scale = max(tolerance, 1e-9)
+        width = self.width
+        height = self.height
         for item in specs:
-            if not {"x", "y"}.issubset(item.keys()):
+            if "x" not in item or "y" not in item:
                 raise LayoutValidationError(
                     "Each panel spec must contain 'x' and 'y'.")
             x_value = float(item["x"])
             y_value = float(item["y"])
-            self._ValidateCoordinateBounds(x_value, y_value, tolerance)
-            if not self.validation.allow_duplicates:
-                key = self._QuantizeCoordinate(x_value, y_value, tolerance)
+            if check_bounds and (x_value < -tolerance or y_value < -tolerance):
+                raise LayoutValidationError(
+                    f"Negative coordinates are not allowed (received x={x_value}, y={y_value})."
+                )
+            if check_duplicates:
+                key = (round(x_value / scale), round(y_value / scale))
                 if key in seen_positions:
                     raise LayoutValidationError(
                         f"Duplicate panel detected at ({x_value}, {y_value})."
                     )
                 seen_positions.add(key)
-            panels.append(Panel(
-                x=x_value, y=y_value, width=self.dimensions.width, height=self.dimensions.height))
+            panels.append(
+                Panel(x=x_value, y=y_value, width=width, height=height))
         if not self.validation.allow_overlaps:
             self._ValidateNoOverlap(panels, tolerance)
         panels.sort(key=lambda panel: (panel.y, panel.x))
         return panels
 
-    def _ValidateCoordinateBounds(self, x_value: float, y_value: float, tolerance: float) -> None:
-        if self.validation.allow_negative_coordinates:
-            return
-        if x_value < -tolerance or y_value < -tolerance:
-            raise LayoutValidationError(
-                f"Negative coordinates are not allowed (received x={x_value}, y={y_value})."
-            )
-
-    def _QuantizeCoordinate(self, x_value: float, y_value: float, tolerance: float) -> Tuple[int, int]:
-        scale = max(tolerance, 1e-9)
-        return (round(x_value / scale), round(y_value / scale))
-
     def _ValidateNoOverlap(self, panels: List[Panel], tolerance: float) -> None:
+        cell_width = max((panel.width for panel in panels), default=0.0)
+        cell_height = max((panel.height for panel in panels), default=0.0)
+        if cell_width <= 0 or cell_height <= 0:
+            return
+        cells: Dict[Tuple[int, int], List[int]] = {}
+        positions: List[Tuple[int, int]] = []
+        for index, panel in enumerate(panels):
+            cell = (math.floor(panel.x / cell_width),
+                    math.floor(panel.y / cell_height))
+            positions.append(cell)
+            cells.setdefault(cell, []).append(index)
         for index, first in enumerate(panels):
-            for second in panels[index + 1:]:
-                if self._RectanglesOverlap(first, second, tolerance):
-                    raise LayoutValidationError(
-                        f"Panel at ({first.x}, {first.y}) overlaps panel at ({second.x}, {second.y})."
-                    )
+            column, row = positions[index]
+            partner: int | None = None
+            for neighbour_column in (column - 1, column, column + 1):
+                for neighbour_row in (row - 1, row, row + 1):
+                    for other in cells.get((neighbour_column, neighbour_row), ()):
+                        if other <= index or (partner is not None and other >= partner):
+                            continue
+                        if self._RectanglesOverlap(first, panels[other], tolerance):
+                            partner = other
+            if partner is not None:
+                second = panels[partner]
+                raise LayoutValidationError(
+                    f"Panel at ({first.x}, {first.y}) overlaps panel at ({second.x}, {second.y})."
+                )
 
     def _RectanglesOverlap(self, first: Panel, second: Panel, tolerance: float) -> bool:
         separated_horizontally = (
@@ -75,13 +93,12 @@ class PanelFactory:
 
 class LayoutCalculator:
     def __init__(self, config: LayoutConfig | None = None) -> None:
-        self.config = config or LoadConfig()
-        self.dimensions = PanelDimensions(
+        self.config = config if config is not None else LoadConfig()
+        self.panel_factory = PanelFactory(
             width=self.config.panel.width,
             height=self.config.panel.height,
+            validation=self.config.validation,
         )
-        self.panel_factory = PanelFactory(
-            self.dimensions, self.config.validation)
         self.rafter_factory = RafterFactory(
             spacing=self.config.rafters.spacing,
             edge_clearance=self.config.rafters.edge_clearance,
@@ -104,8 +121,7 @@ class LayoutCalculator:
         panels = self.panel_factory.BuildPanels(specs)
         if not panels:
             raise LayoutValidationError("At least one panel must be supplied.")
-        min_x = min(panel.x for panel in panels)
-        max_x = max(panel.RightEdge() for panel in panels)
+        min_x, _, max_x, _ = PanelBounds(panels)
         grid = self.rafter_factory.BuildGrid(min_x, max_x)
         mounts = self.mount_calculator.CalculateMounts(panels, grid)
         joints = self.joint_calculator.CalculateJoints(panels)
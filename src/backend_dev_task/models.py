@@ -1,16 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Sequence
+from typing import List, Sequence, Tuple
 
 
-@dataclass(frozen=True)
-class PanelDimensions:
-    width: float = 44.7
-    height: float = 71.1
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Panel:
     x: float
     y: float
@@ -24,19 +18,38 @@ class Panel:
         return self.y + self.height
 
 
-@dataclass(frozen=True)
+def PanelBounds(panels: Sequence[Panel]) -> Tuple[float, float, float, float]:
+    min_x = min_y = float("inf")
+    max_x = max_y = float("-inf")
+    for panel in panels:
+        x_value = panel.x
+        y_value = panel.y
+        right = x_value + panel.width
+        bottom = y_value + panel.height
+        if x_value < min_x:
+            min_x = x_value
+        if y_value < min_y:
+            min_y = y_value
+        if right > max_x:
+            max_x = right
+        if bottom > max_y:
+            max_y = bottom
+    return min_x, min_y, max_x, max_y
+
+
+@dataclass(frozen=True, slots=True)
 class Mount:
     x: float
     y: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Joint:
     x: float
     y: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LayoutResult:
     mounts: Sequence[Mount]
     joints: Sequence[Joint]
@@ -48,7 +61,7 @@ class LayoutResult:
         return len(self.joints)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LayoutContext:
     result: LayoutResult
     panels: Sequence[Panel]
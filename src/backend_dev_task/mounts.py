@@ -8,7 +8,7 @@ from .models import Mount, Panel
 from .rafters import RafterGrid
 
 
-@dataclass
+@dataclass(slots=True)
 class MountCalculator:
     span_limit: float = 48.0
     cantilever_limit: float = 16.0
@@ -17,10 +17,12 @@ class MountCalculator:
     def CalculateMounts(self, panels: Sequence[Panel], grid: RafterGrid) -> List[Mount]:
         mounts: List[Mount] = []
         for panel in panels:
-            mounts.extend(self._CalculatePanelMounts(panel, grid))
+            self._CalculatePanelMounts(panel, grid, mounts)
         return mounts
 
-    def _CalculatePanelMounts(self, panel: Panel, grid: RafterGrid) -> List[Mount]:
+    def _CalculatePanelMounts(
+        self, panel: Panel, grid: RafterGrid, mounts: List[Mount]
+    ) -> None:
         allowed_start = panel.x + self.edge_clearance
         allowed_end = panel.RightEdge() - self.edge_clearance
         rafters = grid.PositionsInRange(allowed_start, allowed_end)
@@ -43,6 +45,5 @@ class MountCalculator:
                 )
         top_y = panel.y
         bottom_y = panel.BottomEdge()
-        panel_mounts = [Mount(x=value, y=top_y) for value in rafters]
-        panel_mounts.extend(Mount(x=value, y=bottom_y) for value in rafters)
-        return panel_mounts
+        mounts.extend([Mount(x=value, y=top_y) for value in rafters])
+        mounts.extend([Mount(x=value, y=bottom_y) for value in rafters])
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import math
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from typing import List
 
@@ -9,24 +11,26 @@ class RafterGrid:
     positions: List[float]
 
     def PositionsInRange(self, start_x: float, end_x: float) -> List[float]:
-        return [value for value in self.positions if start_x - 1e-6 <= value <= end_x + 1e-6]
+        lower = bisect_left(self.positions, start_x - 1e-6)
+        upper = bisect_right(self.positions, end_x + 1e-6)
+        return self.positions[lower:upper]
 
 
+@dataclass(slots=True)
 class RafterFactory:
-    def __init__(self, spacing: float = 16.0, edge_clearance: float = 2.0) -> None:
-        self.spacing = spacing
-        self.edge_clearance = edge_clearance
+    spacing: float = 16.0
+    edge_clearance: float = 2.0
 
     def BuildGrid(self, min_x: float, max_x: float) -> RafterGrid:
         if min_x > max_x:
             raise ValueError("min_x cannot exceed max_x")
-        first_rafter = min_x + self.edge_clearance
-        while first_rafter - self.spacing > min_x - self.spacing * 2:
-            first_rafter -= self.spacing
-        positions: List[float] = []
-        current = first_rafter
+        if self.spacing <= 0:
+            raise ValueError("spacing must be positive")
+        lead_in = max(math.ceil(1 + self.edge_clearance / self.spacing), 0)
+        first_rafter = min_x + self.edge_clearance - lead_in * self.spacing
         limit = max_x + self.spacing * 2
-        while current <= limit:
-            positions.append(round(current, 4))
-            current += self.spacing
+        count = math.floor((limit - first_rafter) / self.spacing + 1e-9) + 1
+        positions = [
+            round(first_rafter + index * self.spacing, 4) for index in range(count)
+        ]
         return RafterGrid(positions)
@@ -1,10 +1,27 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Any, Iterable, Sequence, Tuple
 
 from .exceptions import LayoutValidationError
-from .models import Joint, LayoutResult, Mount, Panel
+from .models import Joint, LayoutResult, Mount, Panel, PanelBounds
+
+_MATPLOTLIB: Tuple[Any, Any, Any] | None = None
+
+
+def _LoadMatplotlib() -> Tuple[Any, Any, Any]:
+    global _MATPLOTLIB
+    if _MATPLOTLIB is None:
+        try:
+            from matplotlib.collections import PatchCollection
+            from matplotlib.figure import Figure
+            from matplotlib.patches import Rectangle
+        except ImportError as error:
+            raise LayoutValidationError(
+                "matplotlib is required for plotting. Install with 'pip install .[viz]'"
+            ) from error
+        _MATPLOTLIB = (Figure, Rectangle, PatchCollection)
+    return _MATPLOTLIB
 
 
 def RenderLayout(
@@ -14,24 +31,21 @@ def RenderLayout(
     output_path: Path | None = None,
     show_plot: bool = False,
 ) -> None:
-    try:
-        import matplotlib.pyplot as plt
-        from matplotlib.patches import Rectangle
-    except ImportError as error:
-        raise LayoutValidationError(
-            "matplotlib is required for plotting. Install with 'pip install .[viz]'"
-        ) from error
+    Figure, Rectangle, PatchCollection = _LoadMatplotlib()
 
     if not panels:
         raise LayoutValidationError("Cannot render layout without panels.")
 
-    min_x = min(panel.x for panel in panels)
-    min_y = min(panel.y for panel in panels)
-    max_x = max(panel.RightEdge() for panel in panels)
-    max_y = max(panel.BottomEdge() for panel in panels)
+    min_x, min_y, max_x, max_y = PanelBounds(panels)
     padding = 5
 
-    fig, ax = plt.subplots(figsize=(8, 6))
+    if show_plot:
+        import matplotlib.pyplot as plt
+
+        fig, ax = plt.subplots(figsize=(8, 6))
+    else:
+        fig = Figure(figsize=(8, 6))
+        ax = fig.subplots()
     ax.set_xlim(min_x - padding, max_x + padding)
     ax.set_ylim(min_y - padding, max_y + padding)
     ax.set_aspect("equal", adjustable="box")
@@ -39,20 +53,28 @@ def RenderLayout(
     ax.set_ylabel("Y")
     ax.set_title("Solar Layout")
 
-    for panel in panels:
-        rect = Rectangle(
-            (panel.x, panel.y),
-            panel.width,
-            panel.height,
-            fill=True,
-            facecolor="#8bbedd",
-            edgecolor="#1f4e79",
+    rects = [
+        Rectangle((panel.x, panel.y), panel.width, panel.height)
+        for panel in panels
+    ]
+    ax.add_collection(
+        PatchCollection(
+            rects,
+            facecolors="#8bbedd",
+            edgecolors="#1f4e79",
             alpha=0.4,
         )
-        ax.add_patch(rect)
-
-    for x_value in rafters:
-        ax.axvline(x=x_value, color="#cccccc", linestyle="--", linewidth=1)
+    )
+
+    if rafters:
+        ax.vlines(
+            rafters,
+            min_y - padding,
+            max_y + padding,
+            colors="#cccccc",
+            linestyles="--",
+            linewidth=1,
+        )
 
     if layout.mounts:
         ax.scatter(
@@ -85,5 +107,4 @@ def RenderLayout(
 
     if show_plot:
         plt.show()
-
-    plt.close(fig)
+        plt.close(fig)
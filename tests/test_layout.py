@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import pytest
 
-from backend_dev_task.cli import ResolvePlotPath
+from backend_dev_task import cli
+from backend_dev_task.cli import ResolvePlotPath, SerializeLayout
 from backend_dev_task.config import (
     JointSettings,
     LayoutConfig,
@@ -12,7 +14,10 @@ from backend_dev_task.config import (
     ValidationSettings,
 )
 from backend_dev_task.exceptions import LayoutValidationError
+from backend_dev_task.joints import JointCalculator
 from backend_dev_task.layout_service import LayoutCalculator
+from backend_dev_task.models import Panel
+from backend_dev_task.rafters import RafterFactory
 from backend_dev_task.visualization import RenderLayout
 
 
@@ -68,6 +73,17 @@ def test_panel_without_available_rafter_raises() -> None:
         calculator.CalculateLayout([{"x": 3.0, "y": 0.0}])
 
 
+def test_rafter_grid_starts_two_spacings_before_first_clearance() -> None:
+    grid = RafterFactory(spacing=16.0, edge_clearance=2.0).BuildGrid(0.0, 44.7)
+    assert grid.positions == [-30.0, -14.0, 2.0, 18.0, 34.0, 50.0, 66.0]
+    assert grid.PositionsInRange(2.0, 42.7) == [2.0, 18.0, 34.0]
+
+
+def test_rafter_grid_rejects_non_positive_spacing() -> None:
+    with pytest.raises(ValueError):
+        RafterFactory(spacing=0.0).BuildGrid(0.0, 44.7)
+
+
 def test_shared_joint_created_once() -> None:
     calculator = LayoutCalculator()
     layout = calculator.CalculateLayout(
@@ -96,6 +112,36 @@ def test_large_horizontal_gap_skips_joint() -> None:
     assert layout.JointCount() == 0
 
 
+def test_row_grouping_tolerates_small_vertical_offsets() -> None:
+    calculator = JointCalculator(vertical_tolerance=0.5)
+    joints = calculator.CalculateJoints(
+        [
+            Panel(x=0.0, y=0.49, width=44.7, height=71.1),
+            Panel(x=44.7, y=0.51, width=44.7, height=71.1),
+            Panel(x=89.4, y=0.2, width=44.7, height=71.1),
+        ]
+    )
+    assert [(joint.x, joint.y) for joint in joints] == [
+        (44.7, 0.49),
+        (89.4, 0.49),
+        (44.7, 71.59),
+        (89.4, 71.59),
+    ]
+
+
+def test_distant_rows_keep_separate_joints() -> None:
+    calculator = JointCalculator()
+    joints = calculator.CalculateJoints(
+        [
+            Panel(x=0.0, y=0.0, width=44.7, height=71.1),
+            Panel(x=44.7, y=0.0, width=44.7, height=71.1),
+            Panel(x=0.0, y=429496.7296, width=44.7, height=71.1),
+            Panel(x=44.7, y=429496.7296, width=44.7, height=71.1),
+        ]
+    )
+    assert len(joints) == 4
+
+
 def test_custom_joint_threshold_via_config(SamplePanels: list[dict[str, float]]) -> None:
     config = LayoutConfig(
         joints=JointSettings(horizontal_gap_threshold=0.0,
@@ -113,6 +159,29 @@ def test_load_config_file_overrides(tmp_path: "Path") -> None:
     assert config.mounts.span_limit == 30
 
 
+def test_load_config_accepts_json(tmp_path: "Path") -> None:
+    config_file = tmp_path / "config.json"
+    config_file.write_text('{"rafters": {"spacing": 1e2}, "panel": {}}')
+    config = LoadConfig(config_file)
+    assert config.rafters.spacing == 100.0
+    assert isinstance(config.rafters.spacing, float)
+    assert config.panel == LayoutConfig().panel
+
+
+def test_load_config_reuses_unchanged_file_and_reloads_edits(tmp_path: "Path") -> None:
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("mounts:\n  span_limit: 30\n")
+    first = LoadConfig(config_file)
+    assert LoadConfig(config_file) is first
+    config_file.write_text("mounts:\n  span_limit: 400\n")
+    assert LoadConfig(config_file).mounts.span_limit == 400
+
+
+def test_load_config_missing_file_raises(tmp_path: "Path") -> None:
+    with pytest.raises(LayoutValidationError):
+        LoadConfig(tmp_path / "missing.yaml")
+
+
 def test_negative_coordinates_rejected_by_default() -> None:
     calculator = LayoutCalculator()
     with pytest.raises(LayoutValidationError):
@@ -159,6 +228,30 @@ def test_overlapping_panels_rejected() -> None:
         ])
 
 
+def test_overlap_detected_in_large_layout() -> None:
+    calculator = LayoutCalculator()
+    specs = [
+        {"x": column * 44.7, "y": row * 71.1}
+        for row in range(20)
+        for column in range(20)
+    ]
+    assert calculator.CalculateLayout(specs).MountCount() > 0
+    specs.append({"x": 19 * 44.7 - 10.0, "y": 19 * 71.1 + 5.0})
+    with pytest.raises(LayoutValidationError):
+        calculator.CalculateLayout(specs)
+
+
+def test_overlap_error_names_first_pair_in_input_order() -> None:
+    calculator = LayoutCalculator()
+    with pytest.raises(LayoutValidationError, match=r"\(0\.0, 0\.0\) overlaps panel at \(10\.0, 0\.0\)"):
+        calculator.CalculateLayout([
+            {"x": 0.0, "y": 0.0},
+            {"x": 100.0, "y": 0.0},
+            {"x": 110.0, "y": 0.0},
+            {"x": 10.0, "y": 0.0},
+        ])
+
+
 def test_overlaps_allowed_via_config() -> None:
     config = LayoutConfig(validation=ValidationSettings(allow_overlaps=True))
     calculator = LayoutCalculator(config=config)
@@ -192,6 +285,18 @@ def test_render_layout_writes_png(tmp_path: "Path", SamplePanels: list[dict[str,
     assert output_path.exists()
 
 
+def test_serialize_layout_equivalent_to_stdlib_json(
+    monkeypatch: pytest.MonkeyPatch, SamplePanels: list[dict[str, float]]
+) -> None:
+    layout = LayoutCalculator().CalculateLayout(SamplePanels)
+    encoded = SerializeLayout(layout)
+    monkeypatch.setattr(cli, "orjson", None)
+    assert json.loads(SerializeLayout(layout)) == json.loads(encoded)
+    payload = json.loads(encoded)
+    assert len(payload["mounts"]) == 54
+    assert payload["joints"][0] == {"x": layout.joints[0].x, "y": layout.joints[0].y}
+
+
 def test_resolve_plot_path_default_uses_json_timestamp(tmp_path: "Path") -> None:
     json_path = tmp_path / "layout_20250101_120000.json"
     resolved = ResolvePlotPath(json_path, None, "20250101_120000")